@@ -2,6 +2,13 @@ import uuid
 from datetime import datetime
 from typing import Any, ClassVar, Dict, List, Optional
 
+try:
+    import instrumentation as instr
+except ImportError:  # запуск із каталогу лабораторної, див. shared_modules.py
+    from pathlib import Path
+    from runpy import run_path
+    instr = run_path(str(Path(__file__).resolve().parent.parent / "shared_modules.py"))["load"]("instrumentation")
+
 '''
 Варіант 7. Клас відстеження помилок, який повинна існувати в єдиному екземплярі. Реалізовувати методи:
 1) Фіксування помилки (Час, код, текст з описом помилки)
@@ -35,12 +42,13 @@ class ErrorTracker:
         self._history: List[ErrorRecord] = []
         self._filename: str = filename
         self._initialized = True
-        print(f"[INIT] ErrorTracker ініціалізовано. Файл логів: {self._filename}")
+        instr.emit(instr.INFO, "[INIT] ErrorTracker ініціалізовано. Файл логів: %s", self._filename)
 
     def log_error(self, code: int, text: str) -> None:
         record = ErrorRecord(code, text)
         self._history.append(record)
-        print(f"[LOGGED] {record}")
+        instr.increment("error_tracker.logged")
+        instr.emit(instr.INFO, "[LOGGED] %s", record)
 
     def show_history(self) -> None:
         if not self._history:
@@ -52,13 +60,14 @@ class ErrorTracker:
     def clear_history(self):
         count: int = len(self._history)
         self._history.clear()
-        print(f"[CLEARED] Видалено {count} записів з історії.")
+        instr.emit(instr.INFO, "[CLEARED] Видалено %d записів з історії.", count)
 
     def save_to_file(self) -> None:
-        with open(self._filename, 'w', encoding='utf-8') as f:
-            for error in self._history:
-                f.write(str(error) + "\n")
-        print(f"[SAVED] Історія помилок збережена до: {self._filename}")
+        with instr.span("error_tracker.save_to_file"):
+            with open(self._filename, 'w', encoding='utf-8') as f:
+                for error in self._history:
+                    f.write(str(error) + "\n")
+        instr.emit(instr.INFO, "[SAVED] Історія помилок збережена до: %s", self._filename)
 
 
 
@@ -1,6 +1,13 @@
 import random
 from typing import Protocol
 
+try:
+    import instrumentation as instr
+except ImportError:  # запуск із каталогу лабораторної, див. shared_modules.py
+    from pathlib import Path
+    from runpy import run_path
+    instr = run_path(str(Path(__file__).resolve().parent.parent / "shared_modules.py"))["load"]("instrumentation")
+
 """
 Варіант 7. Нехай існує кілька стратегій торгів на криптобіржі. Кожна стратегія -це об'єкт, що приймає історію (список) цін криптовалюти і визначає ціну купівлі та ціну продажу.
 Існує кілька стратегій: "Жадібна" - ціна купівлі рівна мінімальній із цін в історії, а ціна продажу - максимальні та "Стратегія середньої ціни" для якої ціна купівлі та ціна продажу рівні середньому арифметичному цін історії.  
@@ -19,7 +26,7 @@ class GreedyStrategy:
             return 0, 0
         buy_price = min(history)
         sell_price = max(history)
-        print(f"--- [Жадібна стратегія]: Ціна купівлі = {buy_price:.2f}, Ціна продажу = {sell_price:.2f} ---")
+        instr.emit(instr.INFO, "--- [Жадібна стратегія]: Ціна купівлі = %.2f, Ціна продажу = %.2f ---", buy_price, sell_price)
         return buy_price, sell_price
     
 class AveragePriceStrategy:
@@ -27,7 +34,7 @@ class AveragePriceStrategy:
         if not history:
             return 0, 0
         average_price = sum(history) / len(history)
-        print(f"--- [Стратегія середньої ціни]: Ціна купівлі/продажу = {average_price:.2f} ---")
+        instr.emit(instr.INFO, "--- [Стратегія середньої ціни]: Ціна купівлі/продажу = %.2f ---", average_price)
         return average_price, average_price
 
 class CryptoExchange:
@@ -45,19 +52,24 @@ class CryptoExchange:
         raise NotImplementedError
     
     def make_decision(self):
-        current_price = self.get_current_price()
-        history = self.get_price_history()
-
-        print(f"\nБіржа: {self.name()}. Поточний курс: {current_price:.2f}")
-
-        buy_price, sell_price = self._strategy.calculate_prices(history)
-
-        if current_price > sell_price:
-            print(">>> РІШЕННЯ: ПРОДАВАТИ")
-        elif current_price < buy_price:
-            print(">>> РІШЕННЯ: КУПУВАТИ")
-        else:
-            print(">>> РІШЕННЯ: ТРИМАТИ")
+        with instr.span("crypto.make_decision"):
+            current_price = self.get_current_price()
+            history = self.get_price_history()
+
+            instr.emit(instr.INFO, "\nБіржа: %s. Поточний курс: %.2f", self.name(), current_price)
+
+            with instr.span("crypto.calculate_prices"):
+                buy_price, sell_price = self._strategy.calculate_prices(history)
+
+            if current_price > sell_price:
+                instr.increment("crypto.decisions.sell")
+                instr.emit(instr.INFO, ">>> РІШЕННЯ: ПРОДАВАТИ")
+            elif current_price < buy_price:
+                instr.increment("crypto.decisions.buy")
+                instr.emit(instr.INFO, ">>> РІШЕННЯ: КУПУВАТИ")
+            else:
+                instr.increment("crypto.decisions.hold")
+                instr.emit(instr.INFO, ">>> РІШЕННЯ: ТРИМАТИ")
 
 class Binance(CryptoExchange):
     def __init__(self, strategy):
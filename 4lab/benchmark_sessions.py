@@ -0,0 +1,78 @@
+import contextlib
+import os
+import random
+import tempfile
+import time
+from typing import List, Optional
+
+from cart_session import SessionStore
+from shopping_planning import AddCommand, MacroCommand, Product, RemoveCommand
+
+"""
+Бенчмарк збереження сесій кошика: час завантаження сесії та розмір
+журналу/знімка на кожні 10 000 операцій, зі знімками та без них.
+Останній рядок — необмежена історія скасування: кожен знімок серіалізує всю
+історію, тому запис із частими знімками сповільнюється в кілька разів.
+Запуск: python benchmark_sessions.py
+"""
+
+OPS = 10_000
+
+
+def make_products(count: int = 50) -> List[Product]:
+    return [Product(name=f"Товар {i}", manufacturer=f"Виробник {i % 7}", price=round(10 + i * 1.5, 2))
+            for i in range(count)]
+
+
+def run_session(store: SessionStore, session_id: str, ops: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    products = make_products()
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        with store.open(session_id) as manager:
+            cart = manager.cart
+            for _ in range(ops):
+                roll = rng.random()
+                if roll < 0.6:
+                    manager.execute(AddCommand(cart, rng.choice(products)))
+                elif roll < 0.8:
+                    manager.execute(RemoveCommand(cart, rng.choice(products)))
+                elif roll < 0.85:
+                    batch = [AddCommand(cart, rng.choice(products)) for _ in range(10)]
+                    manager.execute(MacroCommand(cart, batch, quiet=True))
+                else:
+                    manager.undo()
+            return [p.name for p in cart.items]
+
+
+def file_size(path: str) -> int:
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def benchmark(snapshot_every: int, history_limit: Optional[int] = 1000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        store = SessionStore(directory, snapshot_every=snapshot_every, history_limit=history_limit)
+
+        start = time.perf_counter()
+        expected = run_session(store, "bench", OPS)
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        manager = store.open("bench")
+        load_time = time.perf_counter() - start
+        loaded = [p.name for p in manager.cart.items]
+        manager.close()
+        assert loaded == expected, "Відновлений кошик не збігається з початковим"
+
+        log_size = file_size(store.log_path("bench"))
+        snapshot_size = file_size(store.snapshot_path("bench"))
+        label = f"знімок кожні {snapshot_every}" if snapshot_every else "без знімків"
+        limit = f"історія {history_limit}" if history_limit is not None else "історія без меж"
+        print(f"{label:<22} | {limit:<15} | запис {write_time * 1000:8.1f} мс | завантаження {load_time * 1000:7.1f} мс | "
+              f"журнал {log_size / 1024:7.1f} КБ | знімок {snapshot_size / 1024:6.1f} КБ")
+
+
+if __name__ == "__main__":
+    print(f"Операцій у сесії: {OPS}")
+    for every in (0, 5000, 1000, 250):
+        benchmark(every)
+    benchmark(250, history_limit=None)
@@ -0,0 +1,301 @@
+import json
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from shopping_planning import (AddCommand, CartManager, Command, MacroCommand, Product,
+                               RemoveCommand, ShoppingCart)
+
+"""
+Збереження сесій кошика на диск.
+
+Кожна виконана та скасована команда дописується в журнал операцій сесії
+(<id>.log, один JSON-рядок на операцію). Періодично зберігається компактний
+знімок кошика та історії (<id>.snapshot.json) разом зі зміщенням у журналі,
+тому під час завантаження відтворюється лише хвіст журналу після знімка.
+Одночасно сесію має відкривати лише один процес.
+
+Товари отримують ідентифікатор у межах сесії: кошик порівнює товари за
+ідентичністю, тому два різні об'єкти з однаковими полями лишаються різними
+і після відновлення.
+
+Історія скасування сесії обмежена history_limit останніми діями (як для
+відкритої сесії, так і після відновлення), інакше кожен знімок серіалізував би
+всю історію і його вартість зростала б із довжиною сесії.
+"""
+
+_SESSION_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+_JSON = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+class _ProductTable:
+    # Товари сесії за ідентифікатором. У журналі товар записується повністю
+    # ([id, назва, виробник, ціна]), у знімку команди посилаються на id.
+
+    def __init__(self) -> None:
+        self._products: Dict[int, Product] = {}
+        self._ids: Dict[int, int] = {}  # id(об'єкта) -> ідентифікатор у сесії
+        self._next_id = 0
+
+    def product_id(self, product: Product) -> int:
+        pid = self._ids.get(id(product))
+        if pid is None:
+            pid = self._register(self._next_id, product)
+        return pid
+
+    def encode(self, product: Product) -> List[Any]:
+        return [self.product_id(product), product.name, product.manufacturer, product.price]
+
+    def decode(self, data: Any) -> Product:
+        if isinstance(data, int):
+            return self._products[data]
+        pid = data[0]
+        product = self._products.get(pid)
+        if product is None:
+            product = Product(name=data[1], manufacturer=data[2], price=data[3])
+            self._register(pid, product)
+        return product
+
+    def _register(self, pid: int, product: Product) -> int:
+        # Таблиця тримає посилання на товар, тому id(product) не буде використано повторно
+        self._products[pid] = product
+        self._ids[id(product)] = pid
+        self._next_id = max(self._next_id, pid + 1)
+        return pid
+
+
+def _encode_command(command: Command, encode_product: Callable[[Product], Any]) -> Dict[str, Any]:
+    if type(command) is AddCommand:
+        return {"t": "add", "p": encode_product(command.product)}
+    if type(command) is RemoveCommand:
+        return {"t": "remove", "p": encode_product(command.product)}
+    if type(command) is MacroCommand:
+        data: Dict[str, Any] = {"t": "macro", "q": command.quiet,
+                                "c": [_encode_command(c, encode_product) for c in command.commands]}
+        if command.applied:
+            # Потрібно лише для знімка: що саме було застосовано до кошика
+            data["a"] = [[kind, [_encode_command(c, encode_product) for c in payload] if kind == "other"
+                          else [encode_product(p) for p in payload]]
+                         for kind, payload in command.applied]
+        return data
+    raise TypeError(f"Команду {command.__class__.__name__} неможливо зберегти")
+
+
+def _decode_command(data: Dict[str, Any], cart: ShoppingCart, products: _ProductTable) -> Command:
+    kind = data["t"]
+    if kind == "add":
+        return AddCommand(cart, products.decode(data["p"]))
+    if kind == "remove":
+        return RemoveCommand(cart, products.decode(data["p"]))
+    if kind == "macro":
+        applied = [(run_kind, [_decode_command(c, cart, products) for c in payload] if run_kind == "other"
+                    else [products.decode(p) for p in payload])
+                   for run_kind, payload in data.get("a", [])]
+        return MacroCommand(cart, [_decode_command(c, cart, products) for c in data["c"]], data["q"], applied)
+    raise ValueError(f"Невідомий тип команди у журналі: {kind}")
+
+
+def _apply(command: Command, cart: ShoppingCart, undo: bool) -> None:
+    # Відтворення журналу без виводу та подій
+    if type(command) is MacroCommand:
+        command.replay(undo)
+        return
+    adds = (type(command) is AddCommand) != undo
+    if adds:
+        cart.items.append(command.product)
+    elif command.product in cart.items:
+        cart.items.remove(command.product)
+
+
+def _trim_history(history: List[Command], limit: Optional[int]) -> None:
+    # Однакове правило для відкритої сесії та відтворення журналу
+    if limit is not None and len(history) > limit:
+        del history[:len(history) - limit]
+
+
+class PersistentCartManager(CartManager):
+    # CartManager, який записує кожну операцію в журнал сесії
+
+    def __init__(self, cart: ShoppingCart, store: "SessionStore", session_id: str,
+                 history: Optional[List[Command]] = None, products: Optional[_ProductTable] = None,
+                 seq: int = 0, ops_since_snapshot: int = 0) -> None:
+        super().__init__(cart)
+        if history is not None:
+            self._history = history
+        self._store = store
+        self._session_id = session_id
+        self._products = products if products is not None else _ProductTable()
+        self._seq = seq
+        self._ops_since_snapshot = ops_since_snapshot
+        self._log = open(store.log_path(session_id), "ab")
+
+    @property
+    def cart(self) -> ShoppingCart:
+        return self._cart
+
+    @property
+    def session_id(self) -> str:
+        return self._session_id
+
+    def execute(self, command: Command) -> None:
+        # Кодування до виконання: несеріалізовні команди не потрапляють в історію
+        encoded = _encode_command(command, self._products.encode)
+        super().execute(command)
+        _trim_history(self._history, self._store.history_limit)
+        self._append({"op": "do", "cmd": encoded})
+
+    def undo(self) -> None:
+        had_history = bool(self._history)
+        super().undo()
+        if had_history:
+            self._append({"op": "undo"})
+
+    def snapshot(self) -> None:
+        self._log.flush()
+        self._store.write_snapshot(self._session_id, self._seq, self._log.tell(), self._cart, self._history,
+                                   self._products)
+        self._ops_since_snapshot = 0
+
+    def close(self) -> None:
+        if not self._log.closed:
+            self._log.close()
+
+    def __enter__(self) -> "PersistentCartManager":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        self._seq += 1
+        entry["seq"] = self._seq
+        self._log.write(json.dumps(entry, **_JSON).encode("utf-8") + b"\n")
+        self._log.flush()
+        self._ops_since_snapshot += 1
+        if self._store.snapshot_every and self._ops_since_snapshot >= self._store.snapshot_every:
+            self.snapshot()
+
+
+class SessionStore:
+    # Каталог із сесіями кошиків. snapshot_every=0 вимикає автоматичні знімки,
+    # history_limit=None — необмежена історія скасування (знімки стають дорожчими з часом).
+
+    def __init__(self, directory: str, snapshot_every: int = 1000, history_limit: Optional[int] = 1000) -> None:
+        self._directory = directory
+        self.snapshot_every = snapshot_every
+        self.history_limit = history_limit
+        os.makedirs(directory, exist_ok=True)
+
+    def log_path(self, session_id: str) -> str:
+        return os.path.join(self._directory, f"{self._check_id(session_id)}.log")
+
+    def snapshot_path(self, session_id: str) -> str:
+        return os.path.join(self._directory, f"{self._check_id(session_id)}.snapshot.json")
+
+    def sessions(self) -> List[str]:
+        return sorted(name[:-len(".log")] for name in os.listdir(self._directory) if name.endswith(".log"))
+
+    def open(self, session_id: str) -> PersistentCartManager:
+        # Завантажує сесію (знімок + хвіст журналу) або створює нову
+        cart = ShoppingCart()
+        products = _ProductTable()
+        history: List[Command] = []
+        seq, offset = 0, 0
+
+        snapshot = self._read_snapshot(session_id)
+        if snapshot is not None:
+            seq, offset = snapshot["seq"], snapshot["log_offset"]
+            for data in snapshot["products"]:
+                products.decode(data)
+            cart.add_items([products.decode(pid) for pid in snapshot["items"]], quiet=True)
+            history = [_decode_command(c, cart, products) for c in snapshot["history"]]
+
+        tail, torn = 0, False
+        log_path = self.log_path(session_id)
+        if os.path.exists(log_path):
+            with open(log_path, "rb") as log:
+                log.seek(offset)
+                for line in log:
+                    if not line.endswith(b"\n"):
+                        torn = True  # недописаний рядок після аварійного завершення
+                        break
+                    offset += len(line)
+                    entry = json.loads(line)
+                    if entry["op"] == "do":
+                        command = _decode_command(entry["cmd"], cart, products)
+                        _apply(command, cart, undo=False)
+                        history.append(command)
+                        _trim_history(history, self.history_limit)
+                    elif history:
+                        _apply(history.pop(), cart, undo=True)
+                    seq = entry["seq"]
+                    tail += 1
+
+        if torn:
+            os.truncate(log_path, offset)
+
+        return PersistentCartManager(cart, self, session_id, history, products, seq, tail)
+
+    def delete(self, session_id: str) -> None:
+        for path in (self.log_path(session_id), self.snapshot_path(session_id)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write_snapshot(self, session_id: str, seq: int, log_offset: int, cart: ShoppingCart,
+                       history: List[Command], products: _ProductTable) -> None:
+        # У таблицю знімка потрапляють лише товари з кошика та історії
+        table: Dict[int, List[Any]] = {}
+
+        def product_id(product: Product) -> int:
+            pid = products.product_id(product)
+            if pid not in table:
+                table[pid] = products.encode(product)
+            return pid
+
+        items = [product_id(product) for product in cart.items]
+        encoded_history = [_encode_command(command, product_id) for command in history]
+        data = {
+            "seq": seq,
+            "log_offset": log_offset,
+            "products": list(table.values()),
+            "items": items,
+            "history": encoded_history,
+        }
+        path = self.snapshot_path(session_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, **_JSON)
+        os.replace(tmp_path, path)
+
+    def _read_snapshot(self, session_id: str) -> Optional[Dict[str, Any]]:
+        path = self.snapshot_path(session_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _check_id(session_id: str) -> str:
+        if not _SESSION_ID.match(session_id):
+            raise ValueError(f"Некоректний ідентифікатор сесії: {session_id!r}")
+        return session_id
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SessionStore(directory, snapshot_every=2)
+        milk = Product(name="Молоко", manufacturer="Ферма", price=45.50)
+        bread = Product(name="Хліб", manufacturer="Пекарня", price=25.00)
+
+        with store.open("demo") as manager:
+            manager.execute(AddCommand(manager.cart, milk))
+            manager.execute(AddCommand(manager.cart, bread))
+            manager.execute(RemoveCommand(manager.cart, milk))
+
+        print("\n=== Сесію відновлено ===")
+        with store.open("demo") as manager:
+            print(manager.cart)
+            manager.undo()
+            print(manager.cart)
@@ -1,4 +1,13 @@
-from typing import List, Protocol
+from collections import Counter
+from itertools import groupby
+from typing import Iterable, List, Optional, Protocol, Tuple
+
+try:
+    import instrumentation as instr
+except ImportError:  # запуск із каталогу лабораторної, див. shared_modules.py
+    from pathlib import Path
+    from runpy import run_path
+    instr = run_path(str(Path(__file__).resolve().parent.parent / "shared_modules.py"))["load"]("instrumentation")
 
 """ 
 Варіант  7. Користувач здійснює планування своїх покупок. Для цього він може додавати 
@@ -21,16 +30,54 @@ class ShoppingCart:
     def __init__(self) -> None:
         self._items: List[Product] = []
 
+    @property
+    def items(self) -> List[Product]:
+        return self._items
+
     def add_item(self, product: Product) -> None:
         self._items.append(product)
-        print(f"[Кошик] Додано: {product.name} ({product.manufacturer})")
+        instr.emit(instr.INFO, "[Кошик] Додано: %s (%s)", product.name, product.manufacturer)
 
     def remove_item(self, product: Product) -> None:
         try: 
             self._items.remove(product)
-            print(f"[Кошик] Вилучено: {product.name} ({product.manufacturer})")
+            instr.emit(instr.INFO, "[Кошик] Вилучено: %s (%s)", product.name, product.manufacturer)
         except ValueError:
-            print(f"[Кошик] Помилка: {product.name} не знайдено для вилучення.")
+            instr.emit(instr.WARNING, "[Кошик] Помилка: %s не знайдено для вилучення.", product.name)
+
+    def add_items(self, products: List[Product], quiet: bool = False) -> None:
+        # Масове додавання: один extend замість окремих append
+        self._items.extend(products)
+        if not quiet and instr.enabled(instr.INFO):
+            for product in products:
+                instr.emit(instr.INFO, "[Кошик] Додано: %s (%s)", product.name, product.manufacturer)
+
+    def remove_items(self, products: List[Product], quiet: bool = False) -> List[Product]:
+        # Масове вилучення за один прохід по кошику.
+        # Результат такий самий, як у послідовних remove_item: для кожного товару
+        # вилучаються його перші входження. Повертає товари, які справді вилучено.
+        pending = Counter(products)
+        kept: List[Product] = []
+        for item in self._items:
+            if pending[item] > 0:
+                pending[item] -= 1
+            else:
+                kept.append(item)
+        self._items = kept
+
+        found = Counter(products) - pending
+        removed: List[Product] = []
+        report = not quiet and instr.enabled(instr.INFO)
+        for product in products:
+            if found[product] > 0:
+                found[product] -= 1
+                removed.append(product)
+                if report:
+                    instr.emit(instr.INFO, "[Кошик] Вилучено: %s (%s)", product.name, product.manufacturer)
+            elif not quiet:
+                instr.emit(instr.WARNING, "[Кошик] Помилка: %s не знайдено для вилучення.", product.name)
+        return removed
+
     def __str__(self) -> str:
         if not self._items:
             return "Кошик порожній."
@@ -51,6 +98,10 @@ class AddCommand:
         self._cart: ShoppingCart = cart
         self._product: Product = product
 
+    @property
+    def product(self) -> Product:
+        return self._product
+
     def execute(self) -> None:
         self._cart.add_item(self._product)
 
@@ -63,12 +114,101 @@ class RemoveCommand:
         self._cart: ShoppingCart = cart
         self._product: Product = product
 
+    @property
+    def product(self) -> Product:
+        return self._product
+
     def execute(self) -> None:
         self._cart.remove_item(self._product)
 
     def undo(self) -> None:
         self._cart.add_item(self._product)
 
+class MacroCommand:
+    # Пакет команд, який виконується та скасовується як одна дія.
+    # Послідовні AddCommand/RemoveCommand застосовуються до кошика масово,
+    # інші команди виконуються звичайним чином.
+
+    def __init__(self, cart: ShoppingCart, commands: Iterable[Command], quiet: bool = False,
+                 applied: Optional[List[Tuple[str, list]]] = None) -> None:
+        self._cart: ShoppingCart = cart
+        self._commands: List[Command] = list(commands)
+        self._quiet: bool = quiet
+        # Що саме застосовано: ("add" | "remove", товари) або ("other", команди).
+        # applied передається лише при відновленні вже виконаного пакета.
+        self._applied: List[Tuple[str, list]] = list(applied) if applied else []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    @property
+    def commands(self) -> List[Command]:
+        return self._commands
+
+    @property
+    def quiet(self) -> bool:
+        return self._quiet
+
+    @property
+    def applied(self) -> List[Tuple[str, list]]:
+        return self._applied
+
+    @staticmethod
+    def _kind(command: Command) -> str:
+        if type(command) is AddCommand:
+            return "add"
+        if type(command) is RemoveCommand:
+            return "remove"
+        return "other"
+
+    def execute(self) -> None:
+        self._execute(self._quiet)
+
+    def undo(self) -> None:
+        self._undo(self._quiet)
+
+    def replay(self, undo: bool = False) -> None:
+        # Повторне застосування без жодних подій (наприклад, при відновленні сесії);
+        # власний прапорець quiet пакета не змінюється
+        if undo:
+            self._undo(True)
+        else:
+            self._execute(True)
+
+    def _execute(self, quiet: bool) -> None:
+        self._applied = []
+        for kind, group in groupby(self._commands, key=self._kind):
+            commands = list(group)
+            if kind == "add":
+                products = [command.product for command in commands]
+                self._cart.add_items(products, quiet)
+                self._applied.append((kind, products))
+            elif kind == "remove":
+                products = [command.product for command in commands]
+                removed = self._cart.remove_items(products, quiet)
+                self._applied.append((kind, removed))
+            else:
+                for command in commands:
+                    if quiet and isinstance(command, MacroCommand):
+                        command.replay()
+                    else:
+                        command.execute()
+                self._applied.append((kind, commands))
+
+    def _undo(self, quiet: bool) -> None:
+        for kind, payload in reversed(self._applied):
+            if kind == "add":
+                self._cart.remove_items(payload[::-1], quiet)
+            elif kind == "remove":
+                self._cart.add_items(payload[::-1], quiet)
+            else:
+                for command in reversed(payload):
+                    if quiet and isinstance(command, MacroCommand):
+                        command.replay(undo=True)
+                    else:
+                        command.undo()
+        self._applied = []
+
 class CartManager:
 
     def __init__(self, cart: ShoppingCart) -> None:
@@ -76,18 +216,28 @@ class CartManager:
         self._history: List[Command] = []
 
     def execute(self, command: Command) -> None:
-        print(f"--- Виконання: {command.__class__.__name__} ---")
-        command.execute()
+        instr.emit(instr.INFO, "--- Виконання: %s ---", command.__class__.__name__)
+        with instr.span("cart.execute"):
+            command.execute()
         self._history.append(command)
+        instr.increment("cart.executed")
 
     def undo(self) -> None:
         if not self._history:
-            print("--- Немає дій для скасування ---")
+            instr.emit(instr.INFO, "--- Немає дій для скасування ---")
             return
 
         command = self._history.pop()
-        print(f"--- Скасування: {command.__class__.__name__} ---")
-        command.undo()
+        instr.emit(instr.INFO, "--- Скасування: %s ---", command.__class__.__name__)
+        with instr.span("cart.undo"):
+            command.undo()
+        instr.increment("cart.undone")
+
+    def execute_batch(self, commands: Iterable[Command], quiet: bool = False) -> MacroCommand:
+        # Виконує пакет команд як один запис історії; скасовується одним undo()
+        macro = MacroCommand(self._cart, commands, quiet)
+        self.execute(macro)
+        return macro
 
 if __name__ == "__main__":
     milk = Product(name="Молоко", manufacturer="Ферма", price=45.50)
@@ -121,4 +271,17 @@ if __name__ == "__main__":
     print(cart)
 
     manager.undo() 
-    manager.undo() 
\ No newline at end of file
+    manager.undo() 
+
+    print("\n=== Пакетне виконання (MacroCommand) ===")
+    manager.execute_batch([AddCommand(cart, milk), AddCommand(cart, bread), AddCommand(cart, eggs)])
+    print(cart)
+
+    manager.execute_batch([AddCommand(cart, milk)] * 3 + [RemoveCommand(cart, bread)], quiet=True)
+    print(cart)
+
+    manager.undo()
+    print(cart)
+
+    manager.undo()
+    print(cart)
\ No newline at end of file
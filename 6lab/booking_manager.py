@@ -3,6 +3,13 @@ from datetime import datetime
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+try:
+    import instrumentation as instr
+except ImportError:  # запуск із каталогу лабораторної, див. shared_modules.py
+    from pathlib import Path
+    from runpy import run_path
+    instr = run_path(str(Path(__file__).resolve().parent.parent / "shared_modules.py"))["load"]("instrumentation")
+
 class NotificationStrategy(ABC):
     @abstractmethod
     def send(self, message: str, contact_info: str):
@@ -10,11 +17,15 @@ class NotificationStrategy(ABC):
 
 class EmailNotification(NotificationStrategy):
     def send(self, message: str, contact_info: str):
+        # Доставка сповіщення — не діагностика, тому не залежить від рівня подій
         print(f"[EMAIL to {contact_info}]: {message}")
+        instr.increment("notifications.email")
 
 class SMSNotification(NotificationStrategy):
     def send(self, message: str, contact_info: str):
+        # Доставка сповіщення — не діагностика, тому не залежить від рівня подій
         print(f"[SMS to {contact_info}]: {message}")
+        instr.increment("notifications.sms")
 
 class PaymentStrategy(ABC):
     @abstractmethod
@@ -23,12 +34,12 @@ class PaymentStrategy(ABC):
 
 class CreditCardPayment(PaymentStrategy):
     def pay(self, amount: float) -> bool:
-        print(f"Оплата {amount} грн через Credit Card успішна.")
+        instr.emit(instr.INFO, "Оплата %s грн через Credit Card успішна.", amount)
         return True
 
 class PayPalPayment(PaymentStrategy):
     def pay(self, amount: float) -> bool:
-        print(f"Оплата {amount} грн через PayPal успішна.")
+        instr.emit(instr.INFO, "Оплата %s грн через PayPal успішна.", amount)
         return True
 
 class Ticket:
@@ -187,21 +198,22 @@ class ConcertManager:
         return None
 
 class BookingManager:
+    @instr.timed("booking.create_booking")
     def create_booking(self, user: User, concerts: List[Concert], payment_strategy: PaymentStrategy) -> bool:
         if not concerts:
-            print("Кошик порожній.")
+            instr.emit(instr.WARNING, "Кошик порожній.")
             return False
 
         # 1. Перевірка місць
         for concert in concerts:
             if not concert.has_space():
-                print(f"Помилка: На концерт '{concert.title}' немає місць.")
+                instr.emit(instr.WARNING, "Помилка: На концерт '%s' немає місць.", concert.title)
                 return False
 
         # 2. Оплата
         total_amount = sum(c.price for c in concerts)
         if not payment_strategy.pay(total_amount):
-            print("Помилка оплати.")
+            instr.emit(instr.WARNING, "Помилка оплати.")
             return False
 
         # 3. Резервування та створення квитків
@@ -214,10 +226,13 @@ class BookingManager:
         # 4. Створення об'єкта Booking
         new_booking = Booking(user.email, new_tickets) # Використав email як ID для простоти
         user.add_booking(new_booking)
+        instr.increment("booking.created")
+        instr.increment("booking.tickets_sold", len(new_tickets))
         
         user.notify(f"Успішно створено замовлення {new_booking.booking_id} на {len(new_tickets)} квитків.")
         return True
 
+    @instr.timed("booking.cancel_ticket_in_booking")
     def cancel_ticket_in_booking(self, user: User, ticket_id: str, concert_manager: ConcertManager) -> bool:
         for booking in user.bookings:
             if booking.status == "Confirmed":
@@ -233,8 +248,9 @@ class BookingManager:
                         
                         if not booking.tickets: 
                             booking.cancel_booking() 
-                            print(f"Замовлення {booking.booking_id} повністю скасовано.")
+                            instr.emit(instr.INFO, "Замовлення %s повністю скасовано.", booking.booking_id)
 
+                        instr.increment("booking.tickets_cancelled")
                         user.notify(f"Квиток на {ticket.concert_title} скасовано.")
                         return True
         return False
@@ -252,15 +268,17 @@ class ConcertSystem:
         new_user = User(name, email, phone, password, strategy)
         self._users.append(new_user)
         self._current_user = new_user
-        print(f"Користувач {name} зареєстрований і авторизований.")
+        instr.emit(instr.INFO, "Користувач %s зареєстрований і авторизований.", name)
 
+    @instr.timed("system.login")
     def login(self, email, password):
         for u in self._users:
             if u.email == email and u.check_password(password):
                 self._current_user = u
-                print(f"Вітаємо, {u.name}!")
+                instr.emit(instr.INFO, "Вітаємо, %s!", u.name)
                 return True
-        print("Невірний логін або пароль.")
+        instr.increment("system.failed_logins")
+        instr.emit(instr.WARNING, "Невірний логін або пароль.")
         return False
 
     def add_to_cart(self, concert: Concert):
@@ -271,7 +289,7 @@ class ConcertSystem:
 
     def checkout(self, payment_method: str):
         if not self._current_user:
-            print("Для оплати потрібно увійти в систему!")
+            instr.emit(instr.WARNING, "Для оплати потрібно увійти в систему!")
             return False
         
         strategy = PayPalPayment() if payment_method == "2" else CreditCardPayment()
@@ -282,7 +300,7 @@ class ConcertSystem:
     
     def cancel_ticket(self, ticket_id: str):
         if not self._current_user:
-            print("Помилка: Необхідна авторизація.")
+            instr.emit(instr.WARNING, "Помилка: Необхідна авторизація.")
             return False
         
         result = self._booking_manager.cancel_ticket_in_booking(
@@ -292,9 +310,9 @@ class ConcertSystem:
         )
         
         if result:
-            print("Операція успішна: Квиток скасовано.")
+            instr.emit(instr.INFO, "Операція успішна: Квиток скасовано.")
         else:
-            print("Помилка: Квиток не знайдено або він вже неактивний.")
+            instr.emit(instr.WARNING, "Помилка: Квиток не знайдено або він вже неактивний.")
         return result
     
 
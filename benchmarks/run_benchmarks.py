@@ -0,0 +1,155 @@
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from scenarios import SCENARIOS, Scenario  # додає корінь репозиторію до sys.path
+
+import instrumentation as instr
+
+"""
+Бенчмарки гарячих шляхів усіх лабораторних.
+
+Кожен сценарій запускається на кількох масштабах даних із вимкненими подіями
+інструментування (рівень OFF) та перенаправленим у devnull виводом. Вивід, що є
+результатом роботи (SMS, сповіщення), не залежить від рівня подій і формується повністю;
+записується найкращий час із кількох повторів і пікова пам'ять (tracemalloc, окремий запуск).
+Результати можна зберегти як базові (JSON) і порівняти з ними наступний запуск:
+зростання часу або пам'яті понад поріг вважається регресією (код виходу 1).
+
+    python benchmarks/run_benchmarks.py --save baseline.json
+    python benchmarks/run_benchmarks.py --compare baseline.json --threshold 0.25
+"""
+
+Results = Dict[str, Dict[str, float]]
+
+# Зміни часу, менші за цю величину (секунди), вважаються шумом вимірювання
+TIME_NOISE_FLOOR = 0.001
+
+
+@contextlib.contextmanager
+def _quiet() -> Iterator[None]:
+    level = instr.get_level()
+    instr.configure(level=instr.OFF)
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        instr.configure(level=level)
+
+
+def measure(scenario: Scenario, scale: int, repeat: int) -> Dict[str, float]:
+    # Кожен повтор отримує свіжі дані: дії змінюють стан (кошик, бронювання, історію помилок)
+    best = float("inf")
+    with _quiet():
+        for _ in range(repeat):
+            state = scenario.setup(scale)
+            gc.collect()
+            start = time.perf_counter()
+            scenario.run(state)
+            best = min(best, time.perf_counter() - start)
+            del state
+
+        state = scenario.setup(scale)
+        gc.collect()
+        tracemalloc.start()
+        scenario.run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"time": best, "peak_bytes": peak}
+
+
+def run(names: List[str], repeat: int, max_scales: Optional[int]) -> Results:
+    results: Results = {}
+    for name in names:
+        scenario = SCENARIOS[name]
+        scales = scenario.scales[:max_scales] if max_scales else scenario.scales
+        for scale in scales:
+            key = f"{name}[{scale}]"
+            results[key] = measure(scenario, scale, repeat)
+            print(f"{key:<40} {results[key]['time'] * 1000:10.2f} мс {results[key]['peak_bytes'] / 1024:10.1f} КБ")
+    return results
+
+
+def compare(current: Results, baseline: Results, threshold: float) -> List[str]:
+    regressions: List[str] = []
+    print(f"\nПорівняння з базовими результатами (поріг {threshold:.0%}):")
+    for key, values in current.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<40} немає базового результату")
+            continue
+        notes = []
+        for metric, label in (("time", "час"), ("peak_bytes", "пам'ять")):
+            if not base[metric]:
+                continue
+            change = values[metric] / base[metric] - 1
+            notes.append(f"{label} {change:+.0%}")
+            if metric == "time" and values[metric] - base[metric] < TIME_NOISE_FLOOR:
+                continue
+            if change > threshold:
+                regressions.append(f"{key}: {label} {change:+.0%}")
+        status = "РЕГРЕСІЯ" if any(r.startswith(key + ":") for r in regressions) else "ok"
+        print(f"{key:<40} {', '.join(notes):<30} {status}")
+    return regressions
+
+
+def save(path: str, results: Results) -> None:
+    data = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load(path: str) -> Results:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки гарячих шляхів лабораторних")
+    parser.add_argument("--only", nargs="*", default=[], help="підрядки назв сценаріїв (наприклад, 6lab mod2)")
+    parser.add_argument("--repeat", type=int, default=3, help="кількість повторів для вимірювання часу")
+    parser.add_argument("--quick", action="store_true", help="лише два найменші масштаби")
+    parser.add_argument("--save", metavar="PATH", help="зберегти результати як базові")
+    parser.add_argument("--compare", metavar="PATH", help="порівняти з базовими результатами")
+    parser.add_argument("--threshold", type=float, default=0.2, help="допустиме зростання (0.2 = 20%%)")
+    parser.add_argument("--list", action="store_true", help="показати сценарії та вийти")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:<32} масштаби: {', '.join(map(str, scenario.scales))}")
+        return 0
+
+    names = [name for name in SCENARIOS if not args.only or any(part in name for part in args.only)]
+    if not names:
+        print("Жоден сценарій не відповідає фільтру --only.")
+        return 2
+
+    baseline = load(args.compare) if args.compare else None
+    results = run(names, args.repeat, 2 if args.quick else None)
+    if args.save:
+        save(args.save, results)
+        print(f"\nБазові результати збережено до: {args.save}")
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nЗнайдено регресії:\n  " + "\n  ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import importlib.util
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+"""
+Сценарії бенчмарків для всіх лабораторних. Кожен сценарій має генератор синтетичних
+даних (setup) і дію, час якої вимірюється (run). Каталоги лабораторних не є пакетами
+(назви починаються з цифри), тому модулі завантажуються за шляхом до файлу.
+"""
+
+ROOT = Path(__file__).resolve().parent.parent
+# Спільний instrumentation.py у корені: один екземпляр модуля для всіх лабораторних,
+# тому рівень подій, заданий бенчмарком, діє на всі сценарії
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_WORKDIR = tempfile.TemporaryDirectory(prefix="patterns_bench_")
+
+
+def load_module(relative_path: str, name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    path = ROOT / relative_path
+    # Сусідні модулі лабораторної імпортуються за коротким ім'ям (from main import ...)
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class Scenario:
+    def __init__(self, name: str, setup: Callable[[int], Any], run: Callable[[Any], None],
+                 scales: Tuple[int, ...] = (100, 1_000, 10_000)) -> None:
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.scales = scales
+
+
+# 2lab: ErrorTracker
+
+def _tracker(count: int) -> Any:
+    lab2 = load_module("2lab/main.py", "lab2_main")
+    lab2.ErrorTracker._instance = None  # новий одинак для кожного вимірювання
+    tracker = lab2.ErrorTracker(str(Path(_WORKDIR.name) / "logs.txt"))
+    rng = random.Random(count)
+    errors = [(rng.choice((400, 404, 500, 503)), f"Помилка #{i}: {'x' * rng.randint(10, 80)}") for i in range(count)]
+    return tracker, errors
+
+
+def _log_errors(state: Any) -> None:
+    tracker, errors = state
+    for code, text in errors:
+        tracker.log_error(code, text)
+
+
+def _save_setup(count: int) -> Any:
+    tracker, errors = _tracker(count)
+    _log_errors((tracker, errors))
+    return tracker
+
+
+# 3lab: торгові стратегії
+
+def _price_history(count: int) -> List[float]:
+    rng = random.Random(count)
+    price = 30_000.0
+    history = []
+    for _ in range(count):
+        price = max(1.0, price + rng.gauss(0, 250))
+        history.append(round(price, 2))
+    return history
+
+
+def _strategies_setup(count: int) -> Any:
+    lab3 = load_module("3lab/main.py", "lab3_main")
+    return [lab3.GreedyStrategy(), lab3.AveragePriceStrategy()], _price_history(count)
+
+
+def _calculate_prices(state: Any) -> None:
+    strategies, history = state
+    for _ in range(20):
+        for strategy in strategies:
+            strategy.calculate_prices(history)
+
+
+def _exchanges_setup(count: int) -> Any:
+    lab3 = load_module("3lab/main.py", "lab3_main")
+    history = _price_history(count)
+
+    class SyntheticExchange(lab3.CryptoExchange):
+        def get_price_history(self) -> List[float]:
+            return history
+
+        def name(self) -> str:
+            return "Synthetic"
+
+    lab3.random.seed(count)
+    return [SyntheticExchange(lab3.GreedyStrategy()), SyntheticExchange(lab3.AveragePriceStrategy())]
+
+
+def _make_decisions(exchanges: Any) -> None:
+    for _ in range(20):
+        for exchange in exchanges:
+            exchange.make_decision()
+
+
+# 4lab: кошик і команди
+
+def _products(count: int) -> Any:
+    lab4 = load_module("4lab/shopping_planning.py", "shopping_planning")
+    catalog = [lab4.Product(f"Товар {i}", f"Виробник {i % 13}", 10 + i % 500) for i in range(200)]
+    rng = random.Random(count)
+    return lab4, [rng.choice(catalog) for _ in range(count)]
+
+
+def _execute_undo(state: Any) -> None:
+    lab4, products = state
+    cart = lab4.ShoppingCart()
+    manager = lab4.CartManager(cart)
+    for product in products:
+        manager.execute(lab4.AddCommand(cart, product))
+    for _ in products:
+        manager.undo()
+
+
+def _execute_batch_undo(state: Any) -> None:
+    lab4, products = state
+    cart = lab4.ShoppingCart()
+    manager = lab4.CartManager(cart)
+    manager.execute_batch([lab4.AddCommand(cart, product) for product in products], quiet=True)
+    manager.undo()
+
+
+# 6lab: бронювання квитків
+
+def _booking_setup(count: int) -> Any:
+    lab6 = load_module("6lab/booking_manager.py", "lab6_booking_manager")
+    user = lab6.User("Bench", "bench@example.com", "+380500000000", "secret", lab6.EmailNotification())
+    date = (datetime.now() + timedelta(days=365)).strftime("%d.%m.%Y")
+    concerts = [lab6.Concert(f"Концерт {i}", 500.0 + i, count * 3, date) for i in range(20)]
+    rng = random.Random(count)
+    baskets = [rng.sample(concerts, 3) for _ in range(count)]
+    return lab6, user, baskets
+
+
+def _create_bookings(state: Any) -> None:
+    lab6, user, baskets = state
+    manager = lab6.BookingManager()
+    payment = lab6.CreditCardPayment()
+    for basket in baskets:
+        manager.create_booking(user, basket, payment)
+
+
+def _cancel_setup(count: int) -> Any:
+    lab6, user, baskets = _booking_setup(count)
+    _create_bookings((lab6, user, baskets))
+    concert_manager = lab6.ConcertManager()
+    for concert in {c for basket in baskets for c in basket}:
+        concert_manager.add_concert(concert)
+    ticket_ids = [t.ticket_id for t in user.get_all_active_tickets()]
+    random.Random(count).shuffle(ticket_ids)
+    return lab6, user, ticket_ids, concert_manager
+
+
+def _cancel_tickets(state: Any) -> None:
+    lab6, user, ticket_ids, concert_manager = state
+    manager = lab6.BookingManager()
+    for ticket_id in ticket_ids:
+        manager.cancel_ticket_in_booking(user, ticket_id, concert_manager)
+
+
+def _login_setup(count: int) -> Any:
+    lab6 = load_module("6lab/booking_manager.py", "lab6_booking_manager")
+    system = lab6.ConcertSystem()
+    for i in range(count):
+        system.register(f"User {i}", f"user{i}@example.com", f"+38050{i:07d}", f"pwd{i}", "email")
+    rng = random.Random(count)
+    attempts = [(f"user{i}@example.com", f"pwd{i}") for i in (rng.randrange(count) for _ in range(count))]
+    return system, attempts
+
+
+def _logins(state: Any) -> None:
+    system, attempts = state
+    for email, password in attempts:
+        system.login(email, password)
+
+
+# mod2: візитери
+
+def _patients(count: int) -> Any:
+    mod2 = load_module("mod2/main.py", "main")
+    rng = random.Random(count)
+    kinds = (mod2.Dog, mod2.Cat, mod2.Parrot)
+    animals = [rng.choice(kinds)(f"Тварина{i}", rng.randint(0, 20), f"+38050{i:07d}") for i in range(count)]
+    return mod2, animals
+
+
+def _visitor_dispatch(state: Any) -> None:
+    mod2, animals = state
+    for visitor in (mod2.MedicalExamVisitor(), mod2.GroomingVisitor()):
+        for animal in animals:
+            animal.accept(visitor)
+
+
+def _batch_mailer(state: Any) -> None:
+    mod2, animals = state
+    with mod2.BufferedSink() as sink:
+        mod2.BatchMailer(sink).send_all(animals, [mod2.MedicalExamVisitor(), mod2.GroomingVisitor()])
+
+
+SCENARIOS: Dict[str, Scenario] = {scenario.name: scenario for scenario in (
+    Scenario("2lab.log_error", _tracker, _log_errors),
+    Scenario("2lab.save_to_file", _save_setup, lambda tracker: tracker.save_to_file()),
+    Scenario("3lab.calculate_prices", _strategies_setup, _calculate_prices, (1_000, 10_000, 100_000)),
+    Scenario("3lab.make_decision", _exchanges_setup, _make_decisions, (1_000, 10_000, 100_000)),
+    Scenario("4lab.execute_undo", _products, _execute_undo),
+    Scenario("4lab.execute_batch_undo", _products, _execute_batch_undo),
+    Scenario("6lab.create_booking", _booking_setup, _create_bookings),
+    Scenario("6lab.cancel_ticket_in_booking", _cancel_setup, _cancel_tickets, (100, 500, 2_000)),
+    Scenario("6lab.login", _login_setup, _logins, (100, 500, 2_000)),
+    Scenario("mod2.visitor_dispatch", _patients, _visitor_dispatch),
+    Scenario("mod2.batch_mailer", _patients, _batch_mailer),
+)}
@@ -0,0 +1,309 @@
+import atexit
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+"""
+Спільний шар інструментування для всіх лабораторних.
+
+- emit(level, message, *args) — подія з рівнем; якщо рівень вимкнено, рядок навіть
+  не форматується (аргументи підставляються як у logging: "%s", "%.2f").
+- span(name) / timed(name) — вимірювання часу операцій, increment(name) — лічильники.
+  Метрики за замовчуванням вимкнені; тоді span повертає спільний порожній контекст.
+- Експортери: ConsoleExporter (поведінка за замовчуванням — як print),
+  BufferedFileExporter, RingBufferExporter (для тестів), prometheus_text() для метрик.
+  Буфери експортерів скидаються під час завершення процесу (atexit).
+- SamplingProfiler — вибірковий профайлер стеку з hook-функцією для кожної вибірки.
+
+Рівень можна задати змінною оточення PATTERNS_LOG_LEVEL (DEBUG, INFO, WARNING, ERROR, OFF).
+"""
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES: Dict[int, str] = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR", OFF: "OFF"}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Exporter(ABC):
+    @abstractmethod
+    def export(self, level: int, message: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ConsoleExporter(Exporter):
+    def export(self, level: int, message: str) -> None:
+        print(message)
+
+
+class BufferedFileExporter(Exporter):
+    # Пише події у файл блоками по buffer_lines рядків
+    def __init__(self, path: str, buffer_lines: int = 1024) -> None:
+        self._path = path
+        self._buffer_lines = buffer_lines
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+
+    def export(self, level: int, message: str) -> None:
+        line = f"{datetime.now().isoformat(sep=' ', timespec='milliseconds')} {LEVEL_NAMES.get(level, level)} {message}"
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) < self._buffer_lines:
+                return
+            lines, self._buffer = self._buffer, []
+        self._write(lines)
+
+    def flush(self) -> None:
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        self._write(lines)
+
+    def _write(self, lines: List[str]) -> None:
+        if lines:
+            with open(self._path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+
+class RingBufferExporter(Exporter):
+    # Зберігає останні capacity подій у пам'яті
+    def __init__(self, capacity: int = 1000) -> None:
+        self.events: Deque[Tuple[int, str]] = deque(maxlen=capacity)
+
+    def export(self, level: int, message: str) -> None:
+        self.events.append((level, message))
+
+    def messages(self, min_level: int = DEBUG) -> List[str]:
+        return [message for level, message in self.events if level >= min_level]
+
+    def clear(self) -> None:
+        self.events.clear()
+
+
+class _TimerStats:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.counters: Dict[str, float] = {}
+        self.timers: Dict[str, _TimerStats] = {}
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        stats = self.timers.get(name)
+        if stats is None:
+            stats = self.timers[name] = _TimerStats()
+        stats.count += 1
+        stats.total += seconds
+        if seconds > stats.max:
+            stats.max = seconds
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.timers.clear()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+
+class _Span:
+    __slots__ = ("_name", "_start")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        metrics.observe(self._name, time.perf_counter() - self._start)
+
+
+_NULL_SPAN = _NullSpan()
+
+metrics = Metrics()
+_level = INFO
+_metrics_enabled = False
+_exporters: List[Exporter] = [ConsoleExporter()]
+
+
+def configure(level: Optional[int] = None, exporters: Optional[Sequence[Exporter]] = None,
+              metrics_enabled: Optional[bool] = None) -> None:
+    global _level, _exporters, _metrics_enabled
+    if level is not None:
+        _level = level
+    if exporters is not None:
+        for exporter in _exporters:
+            if exporter not in exporters:
+                exporter.close()
+        _exporters = list(exporters)
+    if metrics_enabled is not None:
+        _metrics_enabled = metrics_enabled
+
+
+def get_level() -> int:
+    return _level
+
+
+def enabled(level: int) -> bool:
+    # Для циклів у гарячих шляхах: перевірити один раз перед циклом замість emit на кожній ітерації
+    return level >= _level
+
+
+def emit(level: int, message: str, *args: Any) -> None:
+    if level < _level:
+        return
+    text = message % args if args else message
+    for exporter in _exporters:
+        exporter.export(level, text)
+
+
+def flush() -> None:
+    for exporter in _exporters:
+        exporter.flush()
+
+
+# Події з буферів (BufferedFileExporter) не губляться, якщо програма не викликала flush()
+atexit.register(flush)
+
+
+def increment(name: str, amount: float = 1) -> None:
+    if _metrics_enabled:
+        metrics.increment(name, amount)
+
+
+def span(name: str) -> Any:
+    return _Span(name) if _metrics_enabled else _NULL_SPAN
+
+
+def timed(name: str) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _metrics_enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.observe(name, time.perf_counter() - start)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def _metric_name(name: str) -> str:
+    return "patterns_" + "".join(ch if ch.isalnum() else "_" for ch in name)
+
+
+def prometheus_text() -> str:
+    # Текстовий формат Prometheus: лічильники, підсумки таймерів (count/sum) і максимум
+    # окремою метрикою-gauge (summary може містити лише _count, _sum і квантилі)
+    lines: List[str] = []
+    for name, value in sorted(metrics.counters.items()):
+        metric = _metric_name(name) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value:g}")
+    for name, stats in sorted(metrics.timers.items()):
+        metric = _metric_name(name) + "_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        lines.append(f"{metric}_count {stats.count}")
+        lines.append(f"{metric}_sum {stats.total:.9f}")
+        lines.append(f"# TYPE {metric}_max gauge")
+        lines.append(f"{metric}_max {stats.max:.9f}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def dump_prometheus(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+
+
+class SamplingProfiler:
+    # Фоновий потік кожні interval секунд знімає стек потоку target і рахує,
+    # у яких функціях він перебуває. hook(frame) викликається для кожної вибірки.
+    def __init__(self, interval: float = 0.005, target: Optional[threading.Thread] = None,
+                 hook: Optional[Callable[[Any], None]] = None) -> None:
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._target = target if target is not None else threading.current_thread()
+        self._hook = hook
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        target_id = self._target.ident
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(target_id)
+            if frame is None:
+                continue
+            if self._hook is not None:
+                self._hook(frame)
+            code = frame.f_code
+            self.samples[f"{os.path.basename(code.co_filename)}:{code.co_name}"] += 1
+
+    def report(self, top: int = 10) -> str:
+        total = sum(self.samples.values())
+        if not total:
+            return "Вибірок немає."
+        return "\n".join(f"{count / total:6.1%} {count:>6}  {location}"
+                         for location, count in self.samples.most_common(top))
+
+
+_env_level = os.environ.get("PATTERNS_LOG_LEVEL", "").upper()
+if _env_level:
+    _levels_by_name = {name: level for level, name in LEVEL_NAMES.items()}
+    if _env_level in _levels_by_name:
+        _level = _levels_by_name[_env_level]
+    else:
+        # Помилка в налаштуванні діагностики не повинна зупиняти програму
+        sys.stderr.write(f"Невідомий рівень PATTERNS_LOG_LEVEL: {_env_level}; використовується INFO\n")
@@ -0,0 +1,50 @@
+import random
+import time
+from typing import List
+
+from campaign import (AsyncDelivery, CampaignRunner, FakeAsyncSMSGateway, FakeSMSGateway, MergePolicy,
+                      ThreadPoolDelivery)
+from main import Animal, Cat, Dog, GroomingVisitor, MedicalExamVisitor, Parrot
+
+"""
+Бенчмарк пропускної здатності кампанії розсилання з локальним шлюзом
+(затримка 5 мс на запит, 1% тимчасових збоїв): кількість повідомлень з об'єднанням
+та без нього, пул потоків проти asyncio.
+Запуск: python benchmark_campaign.py
+"""
+
+ANIMALS = 5_000
+LATENCY = 0.005
+FAILURE_RATE = 0.01
+
+
+def make_patients(count: int, seed: int = 5) -> List[Animal]:
+    # У середньому два улюбленці на власника
+    rng = random.Random(seed)
+    kinds = (Dog, Cat, Parrot)
+    return [rng.choice(kinds)(f"Тварина{i}", rng.randint(0, 20), f"+38050{rng.randrange(count // 2):07d}")
+            for i in range(count)]
+
+
+if __name__ == "__main__":
+    animals = make_patients(ANIMALS)
+    visitors = [MedicalExamVisitor(), GroomingVisitor()]
+    print(f"Тварин: {ANIMALS}, затримка шлюзу: {LATENCY * 1000:.0f} мс, збої: {FAILURE_RATE:.0%}")
+
+    for merge in (False, True):
+        policy = MergePolicy(merge=merge)
+        backends = [
+            ("потоки x64", ThreadPoolDelivery(FakeSMSGateway(LATENCY, FAILURE_RATE, seed=1), max_workers=64,
+                                              backoff=0.001)),
+            ("asyncio x512", AsyncDelivery(FakeAsyncSMSGateway(LATENCY, FAILURE_RATE, seed=1), concurrency=512,
+                                           backoff=0.001)),
+        ]
+        for label, delivery in backends:
+            runner = CampaignRunner(visitors, delivery, policy)
+            start = time.perf_counter()
+            messages = runner.build_messages(animals)
+            build_time = time.perf_counter() - start
+            report = delivery.deliver(messages)
+            mode = "з об'єднанням" if merge else "без об'єднання"
+            print(f"{mode:<15} | {label:<12} | повідомлень: {len(messages):>5} | "
+                  f"підготовка: {build_time * 1000:6.1f} мс | {report}")
@@ -0,0 +1,55 @@
+import contextlib
+import random
+import tempfile
+import time
+from typing import Callable, List, TextIO, Tuple
+
+from main import (Animal, BatchMailer, BufferedSink, Cat, Dog, GroomingVisitor, MedicalExamVisitor,
+                  Parrot)
+
+"""
+Бенчмарк розсилання: виклик accept для кожної тварини (print на кожне повідомлення)
+проти пакетного BatchMailer із буферизованим виводом. Перевіряє, що результати однакові.
+Запуск: python benchmark_mailing.py
+"""
+
+
+def make_patients(count: int, seed: int = 11) -> List[Animal]:
+    rng = random.Random(seed)
+    kinds = (Dog, Cat, Parrot)
+    return [rng.choice(kinds)(f"Тварина{i}", rng.randint(0, 20), f"+38050{i:07d}") for i in range(count)]
+
+
+def per_object(animals: List[Animal], out: TextIO) -> None:
+    with contextlib.redirect_stdout(out):
+        for visitor in (MedicalExamVisitor(), GroomingVisitor()):
+            for animal in animals:
+                animal.accept(visitor)
+
+
+def batched(animals: List[Animal], out: TextIO) -> None:
+    with BufferedSink(out) as sink:
+        BatchMailer(sink).send_all(animals, [MedicalExamVisitor(), GroomingVisitor()])
+
+
+def measure(run: Callable[[List[Animal], TextIO], None], animals: List[Animal]) -> Tuple[float, str]:
+    # Вивід іде у справжній файл з рядковою буферизацією, як у консоль
+    with tempfile.TemporaryFile("w+", encoding="utf-8", buffering=1) as out:
+        start = time.perf_counter()
+        run(animals, out)
+        out.flush()
+        elapsed = time.perf_counter() - start
+        out.seek(0)
+        return elapsed, out.read()
+
+
+if __name__ == "__main__":
+    for count in (10_000, 100_000, 1_000_000):
+        animals = make_patients(count)
+
+        per_object_time, expected = measure(per_object, animals)
+        batch_time, actual = measure(batched, animals)
+
+        assert actual == expected, "Пакетне розсилання дає інший результат"
+        print(f"{count:>9} тварин | accept: {per_object_time:7.3f} с | пакетно: {batch_time:7.3f} с | "
+              f"прискорення x{per_object_time / batch_time:.1f}")
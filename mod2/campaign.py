@@ -0,0 +1,246 @@
+import asyncio
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from main import Animal, Cat, Dog, GroomingVisitor, MedicalExamVisitor, Parrot, TemplateVisitor
+
+"""
+Кампанії розсилання: будь-який набір шаблонних візитерів (TemplateVisitor — інші
+VeterinaryVisitor не мають тексту запрошення, тому CampaignRunner їх відхиляє)
+проходить по тваринах один раз, запрошення для одного номера власника об'єднуються
+в одне повідомлення (якщо дозволяє політика) і доставляються через SMS-шлюз у пулі
+потоків або асинхронно, з обмеженням паралельності та повторними спробами.
+
+Повторюються лише тимчасові помилки (DeliveryError). Будь-яка інша помилка шлюзу
+записується у звіт для свого повідомлення без повтору і не перериває доставку решти,
+тому звіт завжди показує, які повідомлення вже надіслано.
+"""
+
+Message = Tuple[str, str]  # (номер власника, текст)
+
+
+class DeliveryError(Exception):
+    # Тимчасова помилка шлюзу: повідомлення можна надіслати повторно
+    pass
+
+
+class SMSGateway(ABC):
+    @abstractmethod
+    def send(self, phone: str, text: str) -> None:
+        pass
+
+
+class AsyncSMSGateway(ABC):
+    @abstractmethod
+    async def send(self, phone: str, text: str) -> None:
+        pass
+
+
+class _FakeGatewayState:
+    # Спільна логіка локальних шлюзів: затримка, випадкові збої та журнал надісланого
+    def __init__(self, latency: float, failure_rate: float, seed: Optional[int]) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.sent: List[Message] = []
+        self.attempts = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _attempt(self, phone: str, text: str) -> None:
+        with self._lock:
+            self.attempts += 1
+            if self._random.random() < self.failure_rate:
+                raise DeliveryError(f"Шлюз тимчасово недоступний для {phone}")
+            self.sent.append((phone, text))
+
+
+class FakeSMSGateway(_FakeGatewayState, SMSGateway):
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: Optional[int] = None) -> None:
+        super().__init__(latency, failure_rate, seed)
+
+    def send(self, phone: str, text: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        self._attempt(phone, text)
+
+
+class FakeAsyncSMSGateway(_FakeGatewayState, AsyncSMSGateway):
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: Optional[int] = None) -> None:
+        super().__init__(latency, failure_rate, seed)
+
+    async def send(self, phone: str, text: str) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self._attempt(phone, text)
+
+
+class DeliveryReport:
+    def __init__(self) -> None:
+        self.sent = 0
+        self.attempts = 0
+        self.failed: List[Tuple[str, str]] = []  # (номер, остання помилка)
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (f"Надіслано: {self.sent}, помилок: {len(self.failed)}, спроб: {self.attempts}, "
+                f"час: {self.elapsed:.2f} с ({self.throughput:.0f} повідомлень/с)")
+
+
+def _describe(error: Exception) -> str:
+    # Неочікувана помилка шлюзу: тип зберігається у звіті, бо str() часто порожній (TimeoutError())
+    return f"{error.__class__.__name__}: {error}" if str(error) else error.__class__.__name__
+
+
+class ThreadPoolDelivery:
+    # Доставка через синхронний шлюз; max_workers обмежує кількість одночасних запитів
+    def __init__(self, gateway: SMSGateway, max_workers: int = 16, retries: int = 3, backoff: float = 0.05) -> None:
+        self._gateway = gateway
+        self._max_workers = max_workers
+        self._retries = retries
+        self._backoff = backoff
+
+    def _send(self, message: Message) -> Tuple[int, Optional[str]]:
+        phone, text = message
+        error: Optional[str] = None
+        for attempt in range(self._retries + 1):
+            try:
+                self._gateway.send(phone, text)
+                return attempt + 1, None
+            except DeliveryError as e:
+                error = str(e)
+                if attempt < self._retries:
+                    time.sleep(self._backoff * 2 ** attempt)
+            except Exception as e:
+                return attempt + 1, _describe(e)
+        return self._retries + 1, error
+
+    def deliver(self, messages: Sequence[Message]) -> DeliveryReport:
+        report = DeliveryReport()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            for (phone, _), (attempts, error) in zip(messages, pool.map(self._send, messages)):
+                report.attempts += attempts
+                if error is None:
+                    report.sent += 1
+                else:
+                    report.failed.append((phone, error))
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+class AsyncDelivery:
+    # Доставка через асинхронний шлюз; concurrency обмежує кількість одночасних запитів
+    def __init__(self, gateway: AsyncSMSGateway, concurrency: int = 100, retries: int = 3,
+                 backoff: float = 0.05) -> None:
+        self._gateway = gateway
+        self._concurrency = concurrency
+        self._retries = retries
+        self._backoff = backoff
+
+    async def _send(self, message: Message, limit: asyncio.Semaphore) -> Tuple[int, Optional[str]]:
+        phone, text = message
+        error: Optional[str] = None
+        for attempt in range(self._retries + 1):
+            try:
+                async with limit:
+                    await self._gateway.send(phone, text)
+                return attempt + 1, None
+            except DeliveryError as e:
+                error = str(e)
+                if attempt < self._retries:
+                    await asyncio.sleep(self._backoff * 2 ** attempt)
+            except Exception as e:
+                return attempt + 1, _describe(e)
+        return self._retries + 1, error
+
+    async def deliver_async(self, messages: Sequence[Message]) -> DeliveryReport:
+        report = DeliveryReport()
+        start = time.perf_counter()
+        limit = asyncio.Semaphore(self._concurrency)
+        results = await asyncio.gather(*(self._send(message, limit) for message in messages))
+        for (phone, _), (attempts, error) in zip(messages, results):
+            report.attempts += attempts
+            if error is None:
+                report.sent += 1
+            else:
+                report.failed.append((phone, error))
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def deliver(self, messages: Sequence[Message]) -> DeliveryReport:
+        return asyncio.run(self.deliver_async(messages))
+
+
+class MergePolicy:
+    # merge=False — кожне запрошення окремим повідомленням (як у початковому завданні).
+    # Інакше запрошення одному власнику об'єднуються, доки текст не перевищує max_length
+    # (670 символів — 10 сегментів SMS у кирилиці).
+    def __init__(self, merge: bool = True, max_length: int = 670, separator: str = "\n") -> None:
+        self.merge = merge
+        self.max_length = max_length
+        self.separator = separator
+
+    def combine(self, invitations: List[str]) -> List[str]:
+        if not self.merge:
+            return list(invitations)
+        messages: List[str] = []
+        current = ""
+        for invitation in invitations:
+            if current and len(current) + len(self.separator) + len(invitation) > self.max_length:
+                messages.append(current)
+                current = ""
+            current = current + self.separator + invitation if current else invitation
+        if current:
+            messages.append(current)
+        return messages
+
+
+class CampaignRunner:
+    def __init__(self, visitors: Sequence[TemplateVisitor],
+                 delivery: Union[ThreadPoolDelivery, AsyncDelivery],
+                 policy: Optional[MergePolicy] = None) -> None:
+        for visitor in visitors:
+            if not isinstance(visitor, TemplateVisitor):
+                raise TypeError(f"{visitor.__class__.__name__} не підтримує кампанії розсилання")
+        self._visitors = list(visitors)
+        self._delivery = delivery
+        self._policy = policy if policy is not None else MergePolicy()
+
+    def build_messages(self, animals: Iterable[Animal]) -> List[Message]:
+        # Один прохід по тваринах для всіх візитерів; порядок власників — за першою появою
+        per_owner: Dict[str, List[str]] = {}
+        for animal in animals:
+            for visitor in self._visitors:
+                invitation = visitor.invitation(animal)
+                if invitation is not None:
+                    per_owner.setdefault(animal.owner_phone, []).append(invitation)
+        return [(phone, text)
+                for phone, invitations in per_owner.items()
+                for text in self._policy.combine(invitations)]
+
+    def run(self, animals: Iterable[Animal]) -> DeliveryReport:
+        return self._delivery.deliver(self.build_messages(animals))
+
+
+if __name__ == "__main__":
+    clinic_pets: List[Animal] = [
+        Dog("Рекс", 5, "+380501111111"),
+        Cat("Барсик", 3, "+380502222222"),
+        Parrot("Кеша", 2, "+380503333333"),
+        Dog("Арчі", 7, "+380504444444"),
+        Cat("Мурка", 4, "+380501111111"),
+    ]
+
+    gateway = FakeSMSGateway(latency=0.01, failure_rate=0.2, seed=1)
+    runner = CampaignRunner([MedicalExamVisitor(), GroomingVisitor()], ThreadPoolDelivery(gateway, max_workers=4))
+    print(runner.run(clinic_pets))
+    for phone, text in gateway.sent:
+        print(f"\nSMS to {phone}:\n{text}")
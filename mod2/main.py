@@ -1,6 +1,18 @@
 from __future__ import annotations  # Дозволяє використовувати типи класів до їх повного оголошення
+import sys
 from abc import ABC, abstractmethod
-from typing import List
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from string import Formatter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, Type
+
+try:
+    import instrumentation as instr
+except ImportError:  # запуск із каталогу лабораторної, див. shared_modules.py
+    from pathlib import Path
+    from runpy import run_path
+    instr = run_path(str(Path(__file__).resolve().parent.parent / "shared_modules.py"))["load"]("instrumentation")
 
 """
 11.У інформаційній системі ветеринарної клініки є дані обліку різних тварини:
@@ -37,6 +49,9 @@ class VeterinaryVisitor(ABC):
 
 # Елементи (Animals)
 class Animal(ABC):
+    # __slots__ не змінює логіку тварин, але робить об'єкти компактними (без __dict__)
+    __slots__ = ("name", "age", "owner_phone")
+
     def __init__(self, name: str, age: int, owner_phone: str) -> None:
         self.name = name
         self.age = age
@@ -47,50 +62,220 @@ class Animal(ABC):
         pass
 
 class Dog(Animal):
+    __slots__ = ()
+
     def accept(self, visitor: VeterinaryVisitor) -> None:
         visitor.visit_dog(self)
 
 class Cat(Animal):
+    __slots__ = ()
+
     def accept(self, visitor: VeterinaryVisitor) -> None:
         visitor.visit_cat(self)
 
 class Parrot(Animal):
+    __slots__ = ()
+
     def accept(self, visitor: VeterinaryVisitor) -> None:
         visitor.visit_parrot(self)
 
-# Конкретні Візитери 
-class MedicalExamVisitor(VeterinaryVisitor):
-    # Відвідувач для Медичного огляду
+# Назви видів для шаблонів і пакетної обробки. Підкласи (наприклад, порода собаки)
+# належать до виду найближчого базового класу.
+SPECIES_NAMES: Dict[Type[Animal], str] = {Dog: "dog", Cat: "cat", Parrot: "parrot"}
+
+# Пакетні методи візитера для кожного виду
+BATCH_METHODS: Dict[str, str] = {"dog": "visit_dogs", "cat": "visit_cats", "parrot": "visit_parrots"}
+
+SMS_PREFIX = "SMS to {owner_phone}: "
+
+
+@lru_cache(maxsize=None)
+def species_of(animal_type: Type[Animal]) -> str:
+    for base in animal_type.__mro__:
+        if base in SPECIES_NAMES:
+            return SPECIES_NAMES[base]
+    raise TypeError(f"Невідомий вид тварини: {animal_type.__name__}")
+
+
+def group_by_species(animals: Iterable[Animal]) -> Dict[str, Tuple[List[int], List[Animal]]]:
+    # Групує тварин за видом, зберігаючи їхні позиції у вхідній послідовності
+    groups: Dict[str, Tuple[List[int], List[Animal]]] = {}
+    for index, animal in enumerate(animals):
+        species = species_of(type(animal))
+        if species not in groups:
+            groups[species] = ([], [])
+        indices, group = groups[species]
+        indices.append(index)
+        group.append(animal)
+    return groups
+
+
+def _compile_template(template: str) -> Tuple[str, Callable[[Animal], tuple]]:
+    # "{name}" -> "%s" + attrgetter("name"); форматування %-рядка помітно швидше за str.format.
+    # Підтримуються лише прості поля тварини: формати ("{age:03d}") і перетворення ("{name!r}")
+    # не мають відповідника в цьому рендерері, тому шаблон із ними відхиляється.
+    parts: List[str] = []
+    fields: List[str] = []
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field is not None:
+            if format_spec or conversion:
+                raise ValueError(f"Формати та перетворення не підтримуються в шаблоні: {{{field}}} у {template!r}")
+            if field not in Animal.__slots__:
+                raise ValueError(f"Невідоме поле шаблону: {{{field}}} у {template!r}")
+            parts.append("%s")
+            fields.append(field)
+    getter = attrgetter(*fields) if fields else (lambda animal: ())
+    if len(fields) == 1:
+        single = getter
+        getter = lambda animal: (single(animal),)
+    return "".join(parts), getter
+
+
+class TemplateVisitor(VeterinaryVisitor):
+    # Візитер, повідомлення якого задаються текстовими шаблонами для кожного виду.
+    # None замість шаблону — процедура для виду неможлива, повідомлення не надсилається.
+    templates: Dict[str, Optional[str]] = {}
+
+    def __init__(self) -> None:
+        # Шаблони компілюються один раз: текст перетворюється на %-рядок
+        # і функцію, що дістає потрібні атрибути тварини одним викликом.
+        # _renderers — повний текст SMS, _bodies — лише текст запрошення (без адресата).
+        self._bodies: Dict[str, Tuple[str, Callable[[Animal], tuple]]] = {
+            species: _compile_template(template)
+            for species, template in self.templates.items() if template is not None
+        }
+        self._renderers: Dict[str, Tuple[str, Callable[[Animal], tuple]]] = {
+            species: _compile_template(SMS_PREFIX + template)
+            for species, template in self.templates.items() if template is not None
+        }
+
+    def invitation(self, animal: Animal) -> Optional[str]:
+        # Текст запрошення без адресата або None, якщо процедура для тварини неможлива
+        body = self._bodies.get(species_of(type(animal)))
+        if body is None:
+            return None
+        pattern, fields = body
+        return pattern % fields(animal)
+
+    def _send(self, species: str, animal: Animal) -> None:
+        renderer = self._renderers.get(species)
+        if renderer is not None:
+            # Надсилання SMS — не діагностика, тому не залежить від рівня подій
+            pattern, fields = renderer
+            print(pattern % fields(animal))
+            instr.increment("visitor.messages")
+
+    def _render_many(self, species: str, animals: List[Animal]) -> List[Optional[str]]:
+        renderer = self._renderers.get(species)
+        if renderer is None:
+            return [None] * len(animals)
+        pattern, fields = renderer
+        return [pattern % fields(a) for a in animals]
+
     def visit_dog(self, dog: Dog) -> None:
-        msg = (f"SMS to {dog.owner_phone}: Шановний власнику собаки {dog.name}! "
-               f"Запрошуємо на огляд: слухаємо серце та перевіряємо лапи.")
-        print(msg)
+        self._send("dog", dog)
 
     def visit_cat(self, cat: Cat) -> None:
-        msg = (f"SMS to {cat.owner_phone}: Шановний власнику кота {cat.name}! "
-               f"Запрошуємо на огляд: перевіряємо вуха та рефлекси.")
-        print(msg)
+        self._send("cat", cat)
 
     def visit_parrot(self, parrot: Parrot) -> None:
-        msg = (f"SMS to {parrot.owner_phone}: Шановний власнику папуги {parrot.name}! "
-               f"Запрошуємо на огляд: оглядаємо дзьоб та крила.")
-        print(msg)
+        self._send("parrot", parrot)
+
+    # Пакетні методи: повертають повідомлення в тому ж порядку, що й тварини (None — без повідомлення)
+    def visit_dogs(self, dogs: List[Dog]) -> List[Optional[str]]:
+        return self._render_many("dog", dogs)
+
+    def visit_cats(self, cats: List[Cat]) -> List[Optional[str]]:
+        return self._render_many("cat", cats)
+
+    def visit_parrots(self, parrots: List[Parrot]) -> List[Optional[str]]:
+        return self._render_many("parrot", parrots)
+
 
-class GroomingVisitor(VeterinaryVisitor):
+# Конкретні Візитери 
+class MedicalExamVisitor(TemplateVisitor):
+    # Відвідувач для Медичного огляду
+    templates = {
+        "dog": "Шановний власнику собаки {name}! Запрошуємо на огляд: слухаємо серце та перевіряємо лапи.",
+        "cat": "Шановний власнику кота {name}! Запрошуємо на огляд: перевіряємо вуха та рефлекси.",
+        "parrot": "Шановний власнику папуги {name}! Запрошуємо на огляд: оглядаємо дзьоб та крила.",
+    }
+
+class GroomingVisitor(TemplateVisitor):
     # Візитер для Грумінгу
-    def visit_dog(self, dog: Dog) -> None:
-        msg = (f"SMS to {dog.owner_phone}: Шановний власнику собаки {dog.name}! "
-               f"Запрошуємо на грумінг: стрижка машинкою.")
-        print(msg)
+    templates = {
+        "dog": "Шановний власнику собаки {name}! Запрошуємо на грумінг: стрижка машинкою.",
+        "cat": "Шановний власнику кота {name}! Запрошуємо на грумінг: вичісування.",
+        "parrot": None,
+    }
 
-    def visit_cat(self, cat: Cat) -> None:
-        msg = (f"SMS to {cat.owner_phone}: Шановний власнику кота {cat.name}! "
-               f"Запрошуємо на грумінг: вичісування.")
-        print(msg)
 
-    def visit_parrot(self, parrot: Parrot) -> None:
-        pass
+class BufferedSink:
+    # Накопичує рядки та записує їх у потік блоками по buffer_lines рядків замість print на кожен рядок
+    def __init__(self, stream: Optional[TextIO] = None, buffer_lines: int = 4096) -> None:
+        self._stream = stream
+        self._buffer_lines = max(1, buffer_lines)
+        self._buffer: List[str] = []
+
+    def write_many(self, lines: Iterable[str]) -> None:
+        # У буфері ніколи не більше buffer_lines рядків, навіть якщо lines — великий генератор
+        iterator = iter(lines)
+        while True:
+            self._buffer.extend(islice(iterator, self._buffer_lines - len(self._buffer)))
+            if len(self._buffer) < self._buffer_lines:
+                return
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write("\n".join(self._buffer) + "\n")
+        self._buffer.clear()
+
+    def __enter__(self) -> "BufferedSink":
+        return self
 
+    def __exit__(self, *exc: object) -> None:
+        self.flush()
+
+
+class BatchMailer:
+    # Пакетне розсилання: тварини обробляються порціями по chunk_size, у межах порції групуються
+    # за видом, і кожна група передається у пакетний метод візитера. Результат той самий,
+    # що й при виклику accept для кожної тварини, а пам'ять залежить лише від розміру порції.
+    def __init__(self, sink: BufferedSink, chunk_size: int = 4096) -> None:
+        self._sink = sink
+        self._chunk_size = max(1, chunk_size)
+
+    def send(self, animals: Sequence[Animal], visitor: TemplateVisitor) -> int:
+        return self.send_all(animals, [visitor])
+
+    def send_all(self, animals: Sequence[Animal], visitors: Sequence[TemplateVisitor]) -> int:
+        # Повідомлення йдуть у тому ж порядку, що й при окремих проходах accept для кожного
+        # візитера, тому кожен візитер проходить усю послідовність. Потоки тварин (генератори)
+        # передаються порціями через run_campaign з registry.py.
+        if not isinstance(animals, Sequence):
+            raise TypeError("send_all очікує послідовність тварин (list, tuple); потік передавайте порціями")
+        for visitor in visitors:
+            if not isinstance(visitor, TemplateVisitor):
+                raise TypeError(f"{visitor.__class__.__name__} не підтримує пакетне розсилання")
+        with instr.span("mailer.send_all"):
+            sent = 0
+            for visitor in visitors:
+                for start in range(0, len(animals), self._chunk_size):
+                    chunk = animals[start:start + self._chunk_size]
+                    messages: List[Optional[str]] = [None] * len(chunk)
+                    for species, (indices, group) in group_by_species(chunk).items():
+                        rendered = getattr(visitor, BATCH_METHODS[species])(group)
+                        for index, message in zip(indices, rendered):
+                            messages[index] = message
+                    lines = [message for message in messages if message is not None]
+                    self._sink.write_many(lines)
+                    sent += len(lines)
+        instr.increment("mailer.messages", sent)
+        return sent
 
 
 if __name__ == "__main__":
@@ -109,4 +294,9 @@ if __name__ == "__main__":
     print("\nРозсилання запрошень на ГРУМІНГ")
     grooming_visitor = GroomingVisitor()
     for pet in clinic_pets:
-        pet.accept(grooming_visitor)
\ No newline at end of file
+        pet.accept(grooming_visitor)
+
+    print("\nПакетне розсилання (BatchMailer)")
+    with BufferedSink() as sink:
+        mailer = BatchMailer(sink)
+        mailer.send_all(clinic_pets, [med_visitor, grooming_visitor])
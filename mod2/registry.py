@@ -0,0 +1,200 @@
+import csv
+import sqlite3
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from main import SPECIES_NAMES, Animal, BatchMailer, TemplateVisitor, species_of
+
+"""
+Реєстр пацієнтів для кампаній розсилання, що не тримає всіх тварин у пам'яті.
+Тварини читаються з CSV або SQLite порціями (chunk) і одразу передаються візитерам,
+тому пам'ять залежить від розміру порції, а не від кількості пацієнтів.
+Фільтрація за видом і віком у SQLite використовує індекс (species, age).
+
+Формат CSV: заголовок species,name,age,owner_phone; species — dog, cat або parrot.
+"""
+
+CSV_FIELDS = ("species", "name", "age", "owner_phone")
+SPECIES_CLASSES: Dict[str, Type[Animal]] = {name: cls for cls, name in SPECIES_NAMES.items()}
+
+T = TypeVar("T")
+Row = Tuple[str, str, int, str]
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _make_animal(species: str, name: str, age: int, owner_phone: str) -> Animal:
+    try:
+        cls = SPECIES_CLASSES[species]
+    except KeyError:
+        raise ValueError(f"Невідомий вид тварини: {species!r}") from None
+    return cls(name, age, owner_phone)
+
+
+def stream_csv(path: str, chunk_size: int = 10_000) -> Iterator[List[Animal]]:
+    # Порції тварин із CSV-файлу без завантаження всього файлу
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        if tuple(header) != CSV_FIELDS:
+            raise ValueError(f"Очікуваний заголовок CSV: {','.join(CSV_FIELDS)}")
+        for rows in chunked(reader, chunk_size):
+            yield [_make_animal(species, name, int(age), phone) for species, name, age, phone in rows]
+
+
+def write_csv(path: str, animals: Iterable[Animal]) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for animal in animals:
+            writer.writerow((species_of(type(animal)), animal.name, animal.age, animal.owner_phone))
+            count += 1
+    return count
+
+
+class PatientRegistry:
+    # Реєстр у SQLite (path=":memory:" — у пам'яті, для тестів і демонстрації)
+    def __init__(self, path: str) -> None:
+        self._db = sqlite3.connect(path)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS patients (
+                id INTEGER PRIMARY KEY,
+                species TEXT NOT NULL,
+                name TEXT NOT NULL,
+                age INTEGER NOT NULL,
+                owner_phone TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_patients_species_age ON patients (species, age);
+            CREATE INDEX IF NOT EXISTS idx_patients_age ON patients (age);
+        """)
+
+    def add_many(self, animals: Iterable[Animal], chunk_size: int = 10_000) -> int:
+        count = 0
+        for chunk in chunked(animals, chunk_size):
+            rows = [(species_of(type(a)), a.name, a.age, a.owner_phone) for a in chunk]
+            with self._db:
+                self._db.executemany("INSERT INTO patients (species, name, age, owner_phone) VALUES (?, ?, ?, ?)",
+                                     rows)
+            count += len(rows)
+        return count
+
+    def import_csv(self, path: str, chunk_size: int = 10_000) -> int:
+        count = 0
+        for chunk in stream_csv(path, chunk_size):
+            count += self.add_many(chunk, chunk_size)
+        return count
+
+    def count(self, species: Union[str, Sequence[str], None] = None,
+              min_age: Optional[int] = None, max_age: Optional[int] = None) -> int:
+        where, params = self._where(species, min_age, max_age)
+        return self._db.execute(f"SELECT COUNT(*) FROM patients{where}", params).fetchone()[0]
+
+    def iter_chunks(self, species: Union[str, Sequence[str], None] = None,
+                    min_age: Optional[int] = None, max_age: Optional[int] = None,
+                    chunk_size: int = 10_000) -> Iterator[List[Animal]]:
+        # Порції тварин, що відповідають фільтру; умови за видом і віком обчислюються через індекс
+        where, params = self._where(species, min_age, max_age)
+        cursor = self._db.execute(f"SELECT species, name, age, owner_phone FROM patients{where}", params)
+        try:
+            while True:
+                rows: List[Row] = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield [_make_animal(*row) for row in rows]
+        finally:
+            cursor.close()
+
+    def __iter__(self) -> Iterator[Animal]:
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "PatientRegistry":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _where(species: Union[str, Sequence[str], None], min_age: Optional[int],
+               max_age: Optional[int]) -> Tuple[str, List[object]]:
+        conditions: List[str] = []
+        params: List[object] = []
+        if species is not None:
+            names = [species] if isinstance(species, str) else list(species)
+            for name in names:
+                if name not in SPECIES_CLASSES:
+                    raise ValueError(f"Невідомий вид тварини: {name!r}")
+            conditions.append(f"species IN ({', '.join('?' * len(names))})")
+            params.extend(names)
+        if min_age is not None:
+            conditions.append("age >= ?")
+            params.append(min_age)
+        if max_age is not None:
+            conditions.append("age <= ?")
+            params.append(max_age)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+
+def run_campaign(chunks: Iterable[List[Animal]], visitors: Sequence[TemplateVisitor], mailer: BatchMailer) -> int:
+    # Конвеєр: кожна порція проходить через усі візитери і звільняється до читання наступної.
+    # Повідомлення впорядковані в межах порції (спочатку перший візитер, потім другий).
+    sent = 0
+    for chunk in chunks:
+        sent += mailer.send_all(chunk, visitors)
+    return sent
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+    import tracemalloc
+
+    from main import BufferedSink, GroomingVisitor, MedicalExamVisitor
+
+    total = 200_000
+    rng = random.Random(3)
+    species = list(SPECIES_CLASSES)
+
+    def generate() -> Iterator[Animal]:
+        for i in range(total):
+            yield _make_animal(rng.choice(species), f"Тварина{i}", rng.randint(0, 20), f"+38050{i:07d}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "patients.csv")
+        write_csv(csv_path, generate())
+
+        with PatientRegistry(os.path.join(directory, "patients.db")) as registry, \
+                open(os.devnull, "w", encoding="utf-8") as devnull:
+            start = time.perf_counter()
+            registry.import_csv(csv_path)
+            print(f"Імпорт {total} тварин з CSV: {time.perf_counter() - start:.1f} с")
+
+            visitors = [MedicalExamVisitor(), GroomingVisitor()]
+            for label, chunks in (
+                ("усі тварини (CSV)", stream_csv(csv_path)),
+                ("усі тварини (SQLite)", registry.iter_chunks()),
+                ("собаки та коти 3-5 років (індекс)", registry.iter_chunks(["dog", "cat"], 3, 5)),
+            ):
+                tracemalloc.start()
+                start = time.perf_counter()
+                with BufferedSink(devnull) as sink:
+                    sent = run_campaign(chunks, visitors, BatchMailer(sink))
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{label:<36} | повідомлень: {sent:>8} | {elapsed:5.1f} с | пік пам'яті: {peak / 2**20:5.1f} МБ")
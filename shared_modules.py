@@ -0,0 +1,30 @@
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+"""
+Завантаження спільних модулів із кореня репозиторію (instrumentation.py) для скриптів,
+запущених з каталогу лабораторної: тоді sys.path[0] — каталог лабораторної, а не корінь.
+Модуль реєструється в sys.modules під своїм ім'ям, тому всі лабораторні в процесі
+та звичайний "import instrumentation" отримують той самий екземпляр; sys.path не змінюється.
+"""
+
+ROOT = Path(__file__).resolve().parent
+
+
+def load(name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ROOT / f"{name}.py")
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Спільний модуль {name} не знайдено в {ROOT}", name=name)
+    module = importlib.util.module_from_spec(spec)
+    # Реєстрація до виконання, як у звичайному import: повторні імпорти під час виконання бачать модуль
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+    return module